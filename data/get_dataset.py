@@ -1,6 +1,60 @@
-from datasets import load_dataset, load_from_disk
+import json
 import os
 
+def _load_local(dataset_path):
+    """
+    Load a saved dataset directory by memory-mapping its Arrow files directly.
+
+    This skips the metadata walking and fingerprinting that `load_from_disk`
+    does, which dominates load time for large on-disk datasets. Falls back to
+    `load_from_disk` if the directory doesn't look like a plain saved dataset.
+
+    Args:
+        dataset_path (str): Path to a directory created by `save_to_disk`.
+
+    Returns:
+        Dataset or DatasetDict: The loaded dataset.
+    """
+    import pyarrow as pa
+    from datasets import Dataset, DatasetDict, load_from_disk
+
+    def load_split(split_path):
+        # Read the data file list from state.json rather than globbing *.arrow:
+        # the directory may also hold cache-<fingerprint>.arrow shards written
+        # by .map()/.filter(), which must not end up in the loaded dataset
+        with open(os.path.join(split_path, 'state.json')) as f:
+            state = json.load(f)
+        tables = []
+        for data_file in state['_data_files']:
+            arrow_file = os.path.join(split_path, data_file['filename'])
+            with pa.memory_map(arrow_file, 'r') as source:
+                tables.append(pa.ipc.open_stream(source).read_all())
+        if not tables:
+            raise FileNotFoundError(f"No data files listed in {split_path}/state.json")
+        return Dataset(arrow_table=pa.concat_tables(tables))
+
+    try:
+        if os.path.exists(os.path.join(dataset_path, 'dataset_dict.json')):
+            # Directory saved from a DatasetDict: one subdirectory per split
+            splits = [name for name in sorted(os.listdir(dataset_path))
+                      if os.path.isdir(os.path.join(dataset_path, name))]
+            return DatasetDict({split: load_split(os.path.join(dataset_path, split))
+                                for split in splits})
+        return load_split(dataset_path)
+    except Exception:
+        # Unexpected layout; let the generic loader handle it
+        return load_from_disk(dataset_path)
+
+def _get_distributed():
+    """Return torch.distributed if it is available and initialized, else None."""
+    try:
+        import torch.distributed as dist
+    except ImportError:
+        return None
+    if dist.is_available() and dist.is_initialized():
+        return dist
+    return None
+
 def get_dataset(dataset_name_or_path):
     """
     Load a dataset from a local path or from the Hugging Face Hub.
@@ -11,11 +65,26 @@ def get_dataset(dataset_name_or_path):
     Returns:
         Dataset: The loaded dataset.
     """
+    # Import here so importing this module stays cheap; `datasets` pulls in
+    # pyarrow and friends, which takes hundreds of milliseconds.
+    from datasets import load_dataset
+
     if os.path.exists(dataset_name_or_path):
         # Load dataset from local path
-        dataset = load_from_disk(dataset_name_or_path)
+        dataset = _load_local(dataset_name_or_path)
     else:
-        # Load dataset from Hugging Face Hub
-        dataset = load_dataset(dataset_name_or_path)
-    
+        # Load dataset from Hugging Face Hub. In a distributed job, rank 0
+        # downloads and populates the shared cache while the other ranks wait
+        # at the barrier, so N processes don't all hit the hub at once.
+        dist = _get_distributed()
+        if dist is not None:
+            if dist.get_rank() == 0:
+                dataset = load_dataset(dataset_name_or_path)
+                dist.barrier()
+            else:
+                dist.barrier()
+                dataset = load_dataset(dataset_name_or_path)
+        else:
+            dataset = load_dataset(dataset_name_or_path)
+
     return dataset
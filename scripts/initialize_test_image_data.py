@@ -1,19 +1,31 @@
 import argparse
-from datasets import load_dataset, DatasetDict
+import os
 
 def initialize_test_image_data(dataset_name):
+    # Import here so `--help` and module import don't pay the `datasets` import cost
+    from datasets import load_dataset, DatasetDict
+
     # Load the dataset
     dataset = load_dataset(dataset_name)
     
-    # Create a tiny version of the dataset containing the 1st 8 samples per split
-    tiny_dataset = {split: data.select(range(8)) for split, data in dataset.items()}
-    
+    # Create a tiny version of the dataset containing the 1st 8 samples per split.
+    # keep_in_memory avoids re-opening the source memmap when the tiny splits are written out.
+    tiny_dataset = {split: data.select(range(min(8, len(data))), keep_in_memory=True)
+                    for split, data in dataset.items()}
+
     # Convert the dictionary of splits to a DatasetDict
     tiny_dataset_dict = DatasetDict(tiny_dataset)
-    
-    # Save the DatasetDict to the specified directory
+
+    # Save the DatasetDict to the specified directory, writing shards in parallel.
+    # num_proc must not exceed the smallest split's row count or save_to_disk
+    # raises an IndexError, and cpu_count() can return None.
+    smallest_split = min(len(split) for split in tiny_dataset.values())
     save_path = f"test_data/tiny_{dataset_name}"
-    tiny_dataset_dict.save_to_disk(save_path)
+    tiny_dataset_dict.save_to_disk(
+        save_path,
+        num_proc=max(1, min(smallest_split, (os.cpu_count() or 1) // 2)),
+        max_shard_size="50MB",
+    )
     print(f"Tiny dataset saved to {save_path}")
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+import pytest
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: marks tests that hit the network or are otherwise slow"
+    )
+
+def pytest_collection_modifyitems(config, items):
+    # Skip slow tests unless they are explicitly requested with `-m slow`
+    if "slow" in config.getoption("-m"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; run with -m slow to include it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)